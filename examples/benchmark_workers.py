@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Scaling benchmark for parallel license resolution.
+
+Loads the DNF metadata once, then times resolve_licenses_parallel() for
+1, 2, 4 and 8 workers over the unique package names of a CSV file.
+
+Usage: python benchmark_workers.py sample.csv
+"""
+
+import sys
+import time
+
+import dnf
+import pandas as pd
+
+from license_updater import resolve_licenses_parallel
+
+WORKER_COUNTS = [1, 2, 4, 8]
+
+
+def main():
+    """Run the scaling benchmark for the CSV given on the command line."""
+    csv_file_path = sys.argv[1] if len(sys.argv) > 1 else "sample.csv"
+    df = pd.read_csv(csv_file_path)
+    to_process = df.loc[df['UBI?'].str.lower() == 'no', 'package']
+    package_names = list(dict.fromkeys(to_process))
+
+    print("Initializing DNF base and loading repository metadata...")
+    base = dnf.Base()
+    base.read_all_repos()
+    base.fill_sack()
+
+    print(f"Resolving {len(package_names)} unique packages\n")
+    print(f"{'workers':>8} {'seconds':>10} {'speedup':>8}")
+
+    baseline = None
+    for workers in WORKER_COUNTS:
+        start = time.perf_counter()
+        resolve_licenses_parallel(package_names, base, workers)
+        elapsed = time.perf_counter() - start
+        if baseline is None:
+            baseline = elapsed
+        print(f"{workers:>8} {elapsed:>10.2f} {baseline / elapsed:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
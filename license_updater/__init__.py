@@ -5,18 +5,32 @@ This package provides functionality to query DNF repositories and update
 license information for packages listed in CSV files.
 """
 
+from .aio import (
+    AsyncLicenseResolver,
+    aget_package_license,
+    aget_package_licenses
+)
 from .core import (
     get_package_license,
+    get_package_licenses,
     is_newer_package,
+    resolve_licenses_parallel,
     update_licenses_from_dnf
 )
+from .diff import diff_license_csvs
 
 __version__ = "1.0.0"
 __author__ = "License Updater Project"
 __email__ = "your.email@example.com"
 
 __all__ = [
+    "AsyncLicenseResolver",
+    "aget_package_license",
+    "aget_package_licenses",
+    "diff_license_csvs",
     "get_package_license",
+    "get_package_licenses",
     "is_newer_package", 
+    "resolve_licenses_parallel",
     "update_licenses_from_dnf"
 ] 
\ No newline at end of file
@@ -1,7 +1,8 @@
 """
 Main entry point for running license_updater as a module.
 
-Usage: python -m license_updater input.csv [-o output.csv]
+Usage: python -m license_updater input.csv [-o output.csv] [-w N]
+       python -m license_updater diff old.csv new.csv [--json]
 """
 
 from .cli import main
@@ -0,0 +1,201 @@
+"""
+Asyncio API for looking up package licenses from services.
+
+All sack work runs on a single dedicated executor thread bound to one shared
+DNF base, so the event loop is never blocked. Concurrent lookups for the
+same package share one in-flight query, and lookups arriving within a short
+window are batched into one multi-name query.
+"""
+
+import asyncio
+import functools
+import sys
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+import dnf
+
+from .core import get_package_licenses, strip_arch
+
+
+class _LoopState:
+    """Lookups waiting on one event loop."""
+
+    def __init__(self):
+        self.inflight = {}
+        self.pending = []
+        self.flush_handle = None
+
+
+class AsyncLicenseResolver:
+    """
+    Resolve package licenses from asyncio code without blocking the loop.
+
+    A resolver can be shared by several event loops. The executor thread and
+    DNF base are shared, while in-flight and pending lookups are tracked per
+    loop, so lookups are only coalesced with others on the same loop.
+
+    Args:
+        base (dnf.Base, optional): DNF Base object with a filled sack. If
+                                   None, one is created on the executor
+                                   thread on first use.
+        batch_window (float, optional): Seconds to wait for more lookups
+                                        before sending a batch query.
+    """
+
+    def __init__(self, base=None, batch_window=0.005):
+        self._base = base
+        self._batch_window = batch_window
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="license-updater-dnf")
+        self._closed = False
+        self._states = weakref.WeakKeyDictionary()
+        self._states_lock = threading.Lock()
+
+    async def get_package_license(self, package_name):
+        """
+        Look up the License of a package.
+
+        The lookup is batched with others made on the same loop. If the
+        batch query fails, every name in it, including names requested by
+        other callers, gets 'Error: Unexpected'.
+
+        Args:
+            package_name (str): The name of the package.
+
+        Returns:
+            str: The license string, or 'N/A' / 'Error: Unexpected' as
+                 returned by get_package_licenses.
+
+        Raises:
+            RuntimeError: If the resolver has been closed.
+        """
+        if self._closed:
+            raise RuntimeError("AsyncLicenseResolver is closed")
+
+        loop = asyncio.get_running_loop()
+        with self._states_lock:
+            state = self._states.get(loop)
+            if state is None:
+                state = self._states[loop] = _LoopState()
+
+        clean_name = strip_arch(package_name)
+        future = state.inflight.get(clean_name)
+        if future is None:
+            future = loop.create_future()
+            state.inflight[clean_name] = future
+            state.pending.append(clean_name)
+            if state.flush_handle is None:
+                state.flush_handle = loop.call_later(
+                    self._batch_window, self._flush, loop, state)
+        # Shield so one cancelled caller does not cancel the shared lookup
+        return await asyncio.shield(future)
+
+    async def get_package_licenses(self, package_names):
+        """
+        Look up the License of several packages.
+
+        Args:
+            package_names (list): The names of the packages.
+
+        Returns:
+            dict: Mapping of each package name to its license string.
+        """
+        package_names = list(package_names)
+        licenses = await asyncio.gather(
+            *(self.get_package_license(name) for name in package_names))
+        return dict(zip(package_names, licenses))
+
+    def close(self):
+        """Shut down the executor thread."""
+        self._closed = True
+        self._executor.shutdown(wait=False)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _flush(self, loop, state):
+        """Send all pending names of a loop to the executor as one batch."""
+        state.flush_handle = None
+        names, state.pending = state.pending, []
+        try:
+            batch = loop.run_in_executor(self._executor, self._lookup, names)
+        except Exception as e:
+            # e.g. the resolver was closed while the batch was pending
+            for name in names:
+                future = state.inflight.pop(name, None)
+                if future is not None and not future.done():
+                    future.set_exception(e)
+            return
+        batch.add_done_callback(
+            functools.partial(self._deliver, state, names))
+
+    def _lookup(self, names):
+        """Run a batch query on the executor thread."""
+        if self._base is None:
+            try:
+                base = dnf.Base()
+                base.read_all_repos()
+                base.fill_sack()
+            except Exception as e:
+                print(f"Error initializing DNF: {e}", file=sys.stderr)
+                return {name: "Error: Unexpected" for name in names}
+            self._base = base
+        return get_package_licenses(names, self._base)
+
+    def _deliver(self, state, names, batch):
+        """Resolve the waiting futures of a finished batch."""
+        for name in names:
+            future = state.inflight.pop(name, None)
+            if future is None or future.done():
+                continue
+            if batch.cancelled():
+                future.cancel()
+            elif batch.exception() is not None:
+                future.set_exception(batch.exception())
+            else:
+                future.set_result(batch.result()[name])
+
+
+_default_resolver = None
+_default_resolver_lock = threading.Lock()
+
+
+def _get_default_resolver():
+    """Return the shared resolver, creating it on first use."""
+    global _default_resolver
+    with _default_resolver_lock:
+        if _default_resolver is None:
+            _default_resolver = AsyncLicenseResolver()
+        return _default_resolver
+
+
+async def aget_package_license(package_name):
+    """
+    Async version of get_package_license using a shared resolver.
+
+    Args:
+        package_name (str): The name of the package.
+
+    Returns:
+        str: The extracted license string, or 'N/A' if not found, or
+             'Error: Unexpected' if the batch it was sent in failed.
+    """
+    return await _get_default_resolver().get_package_license(package_name)
+
+
+async def aget_package_licenses(package_names):
+    """
+    Async lookup of several package licenses using a shared resolver.
+
+    Args:
+        package_names (list): The names of the packages.
+
+    Returns:
+        dict: Mapping of each package name to its license string.
+    """
+    return await _get_default_resolver().get_package_licenses(package_names)
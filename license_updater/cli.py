@@ -3,14 +3,57 @@ Command Line Interface for License Updater.
 """
 
 import argparse
+import sys
 from .core import update_licenses_from_dnf
+from .diff import diff_license_csvs, print_license_diff
 
 
-def main():
+def diff_main(argv):
+    """CLI entry point for 'license_updater diff old new'."""
+    parser = argparse.ArgumentParser(
+        prog="license_updater diff",
+        description=("Report packages added, removed or with a changed "
+                     "'License' between two license-updated CSV files.")
+    )
+    parser.add_argument(
+        "old_csv",
+        type=str,
+        help="Path to the older license-updated CSV file"
+    )
+    parser.add_argument(
+        "new_csv",
+        type=str,
+        help="Path to the newer license-updated CSV file"
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Optional: Print the differences as JSON."
+    )
+
+    args = parser.parse_args(argv)
+
+    result = diff_license_csvs(args.old_csv, args.new_csv)
+    if result is None:
+        sys.exit(1)
+    print_license_diff(result, as_json=args.json)
+
+
+def main(argv=None):
     """Main CLI entry point."""
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv and argv[0] == "diff":
+        diff_main(argv[1:])
+        return
+
     parser = argparse.ArgumentParser(
         description=("Update 'License' column in a CSV based on "
-                     "DNF API queries.")
+                     "DNF API queries."),
+        epilog=("To compare two license-updated CSV files, run "
+                "'license_updater diff old.csv new.csv [--json]'. "
+                "To update a CSV file literally named 'diff', pass it "
+                "as './diff'.")
     )
     parser.add_argument(
         "input_csv",
@@ -25,10 +68,21 @@ def main():
               "provided, the updated data will be printed to console.")
     )
 
-    args = parser.parse_args()
+    parser.add_argument(
+        "-w", "--workers",
+        type=int,
+        default=1,
+        help=("Optional: Number of worker processes used to resolve "
+              "licenses. The DNF metadata is loaded once and shared with "
+              "the workers. Defaults to 1.")
+    )
+
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
 
     # Call the main function with provided arguments
-    update_licenses_from_dnf(args.input_csv, args.output_csv)
+    update_licenses_from_dnf(args.input_csv, args.output_csv, args.workers)
 
 
 if __name__ == "__main__":
@@ -1,6 +1,73 @@
 import pandas as pd
 import dnf
+import functools
+import multiprocessing
 import sys
+from concurrent.futures import ProcessPoolExecutor
+
+
+# DNF base shared with forked worker processes. It is set in the parent
+# right before the pool is created so every worker inherits the already
+# filled sack through copy-on-write instead of reloading repo metadata.
+_worker_base = None
+
+
+def strip_arch(package_name):
+    """
+    Strip a known architecture suffix from a package name for DNF queries,
+    e.g. "boost-atomic.x86_64" -> "boost-atomic".
+
+    Args:
+        package_name (str): The name of the package.
+
+    Returns:
+        str: The package name without its architecture suffix.
+    """
+    if '.' in package_name:
+        # Check if the part after the last dot looks like an architecture
+        parts = package_name.rsplit('.', 1)
+        if len(parts) == 2:
+            name_part, arch_part = parts
+            # Common architectures
+            common_archs = ['x86_64', 'i686', 'noarch', 'aarch64', 'ppc64le', 's390x']
+            if arch_part in common_archs:
+                return name_part
+    return package_name
+
+
+def _select_package(packages, get_latest_packages):
+    """
+    Pick the package whose License is reported for one package name.
+
+    Args:
+        packages (list): All available packages with that name.
+        get_latest_packages (callable): Returns the packages kept by DNF's
+                                        latest() for that name. Only called
+                                        when there are several packages.
+
+    Returns:
+        dnf.package.Package: The selected package, or None if there are
+                             no packages.
+    """
+    if not packages:
+        return None
+    
+    # If only one package, use it
+    if len(packages) == 1:
+        return packages[0]
+    
+    # If multiple packages, find the latest version using DNF's latest() method
+    latest_packages = get_latest_packages()
+    if latest_packages:
+        return latest_packages[0]
+    
+    # Fallback: manually find the newest package
+    latest_package = packages[0]
+    for pkg in packages[1:]:
+        if is_newer_package(pkg, latest_package):
+            latest_package = pkg
+    
+    return latest_package
 
 
 def get_package_license(package_name, base=None):
@@ -22,18 +89,7 @@ def get_package_license(package_name, base=None):
             base.read_all_repos()
             base.fill_sack()
         
-        # Strip architecture suffix from package name for DNF API query
-        # e.g., "boost-atomic.x86_64" -> "boost-atomic"
-        clean_package_name = package_name
-        if '.' in package_name:
-            # Check if the part after the last dot looks like an architecture
-            parts = package_name.rsplit('.', 1)
-            if len(parts) == 2:
-                name_part, arch_part = parts
-                # Common architectures
-                common_archs = ['x86_64', 'i686', 'noarch', 'aarch64', 'ppc64le', 's390x']
-                if arch_part in common_archs:
-                    clean_package_name = name_part
+        clean_package_name = strip_arch(package_name)
         
         # Query for packages by name
         q = base.sack.query()
@@ -41,28 +97,10 @@ def get_package_license(package_name, base=None):
         
         # Convert to list to evaluate the query
         packages = list(available_packages)
+        package = _select_package(
+            packages, lambda: list(available_packages.latest()))
         
-        if not packages:
-            return "N/A"
-        
-        # If only one package, return its license
-        if len(packages) == 1:
-            return packages[0].license or "N/A"
-        
-        # If multiple packages, find the latest version using DNF's latest() method
-        latest_packages = available_packages.latest()
-        latest_packages_list = list(latest_packages)
-        
-        if latest_packages_list:
-            return latest_packages_list[0].license or "N/A"
-        
-        # Fallback: manually find the newest package
-        latest_package = packages[0]
-        for pkg in packages[1:]:
-            if is_newer_package(pkg, latest_package):
-                latest_package = pkg
-        
-        return latest_package.license or "N/A"
+        return (package.license or "N/A") if package else "N/A"
         
     except Exception as e:
         error_msg = (f"An unexpected error occurred for package "
@@ -71,6 +109,77 @@ def get_package_license(package_name, base=None):
         return "Error: Unexpected"
 
 
+def _group_by_name(packages):
+    """
+    Group packages by name, keeping the order DNF returned them in.
+
+    Args:
+        packages (iterable): DNF packages or query.
+
+    Returns:
+        dict: Mapping of package name to a list of packages.
+    """
+    grouped = {}
+    for pkg in packages:
+        grouped.setdefault(pkg.name, []).append(pkg)
+    return grouped
+
+
+def get_package_licenses(package_names, base=None):
+    """
+    Uses a single DNF query to look up the License of several packages.
+
+    Args:
+        package_names (list): The names of the packages.
+        base (dnf.Base, optional): Reusable DNF Base object.
+
+    Returns:
+        dict: Mapping of each package name to its license string, 'N/A' if
+              not found, or 'Error: Unexpected' if the query failed.
+    """
+    package_names = list(package_names)
+    try:
+        # Create DNF base if not provided
+        if base is None:
+            base = dnf.Base()
+            base.read_all_repos()
+            base.fill_sack()
+
+        clean_names = {name: strip_arch(name) for name in package_names}
+
+        q = base.sack.query()
+        available_packages = q.available().filter(
+            name=list(set(clean_names.values())))
+
+        packages_by_name = _group_by_name(available_packages)
+        latest_by_name = None
+
+        def get_latest_packages(name):
+            # Evaluate latest() once for all names, and only if needed
+            nonlocal latest_by_name
+            if latest_by_name is None:
+                latest_by_name = _group_by_name(available_packages.latest())
+            return latest_by_name.get(name, [])
+
+        selected = {
+            name: _select_package(
+                packages, functools.partial(get_latest_packages, name))
+            for name, packages in packages_by_name.items()
+        }
+
+        licenses = {}
+        for name, clean_name in clean_names.items():
+            pkg = selected.get(clean_name)
+            licenses[name] = (pkg.license or "N/A") if pkg else "N/A"
+        return licenses
+
+    except Exception as e:
+        error_msg = (f"An unexpected error occurred for "
+                     f"{len(package_names)} packages: {e}")
+        print(error_msg, file=sys.stderr)
+        return {name: "Error: Unexpected" for name in package_names}
+
+
 def is_newer_package(pkg1, pkg2):
     """
     Compare two package objects to determine if pkg1 is newer than pkg2.
@@ -104,7 +213,66 @@ def is_newer_package(pkg1, pkg2):
             return str(pkg1) > str(pkg2)
 
 
-def update_licenses_from_dnf(csv_file_path, output_file_path=None):
+def _resolve_shard(package_names):
+    """
+    Resolve licenses for one shard of package names inside a worker process.
+
+    Args:
+        package_names (list): Package names assigned to this worker.
+
+    Returns:
+        list: License strings in the same order as package_names.
+    """
+    return [get_package_license(name, _worker_base) for name in package_names]
+
+
+def resolve_licenses_parallel(package_names, base, workers):
+    """
+    Resolve licenses for many packages using forked worker processes.
+
+    The already filled DNF base is shared with the workers copy-on-write,
+    so the repository metadata is loaded only once. Each worker handles a
+    contiguous shard of the names and the results are merged back in
+    input order.
+
+    Args:
+        package_names (list): Unique package names to resolve.
+        base (dnf.Base): DNF Base object with a filled sack.
+        workers (int): Number of worker processes to fork.
+
+    Returns:
+        dict: Mapping of package name to license string.
+    """
+    global _worker_base
+
+    package_names = list(package_names)
+    workers = max(1, min(workers, len(package_names)))
+    if workers == 1:
+        return {name: get_package_license(name, base)
+                for name in package_names}
+
+    shard_size = -(-len(package_names) // workers)
+    shards = [package_names[i:i + shard_size]
+              for i in range(0, len(package_names), shard_size)]
+
+    _worker_base = base
+    try:
+        # "fork" is required: spawned workers would not inherit the sack
+        # A dead worker raises BrokenProcessPool instead of hanging the run
+        context = multiprocessing.get_context("fork")
+        with ProcessPoolExecutor(max_workers=len(shards),
+                                 mp_context=context) as executor:
+            results = list(executor.map(_resolve_shard, shards))
+    finally:
+        _worker_base = None
+
+    licenses = {}
+    for shard, shard_licenses in zip(shards, results):
+        licenses.update(zip(shard, shard_licenses))
+    return licenses
+
+
+def update_licenses_from_dnf(csv_file_path, output_file_path=None, workers=1):
     """
     Reads a CSV, updates 'License' column based on DNF API queries,
     and optionally saves the updated DataFrame to a new CSV.
@@ -114,6 +282,10 @@ def update_licenses_from_dnf(csv_file_path, output_file_path=None):
         output_file_path (str, optional): Path to save the updated CSV.
                                           If None, the updated DataFrame is
                                           printed.
+        workers (int, optional): Number of worker processes used to resolve
+                                 licenses. With more than one worker the
+                                 unique package names are resolved in
+                                 parallel before the CSV is updated.
     """
     try:
         df = pd.read_csv(csv_file_path)
@@ -137,13 +309,30 @@ def update_licenses_from_dnf(csv_file_path, output_file_path=None):
         print(f"Error initializing DNF: {e}", file=sys.stderr)
         return
 
+    # Resolve all unique package names up front when using workers
+    licenses = None
+    if workers > 1:
+        to_process = df.loc[df['UBI?'].str.lower() == 'no', 'package']
+        unique_names = list(dict.fromkeys(to_process))
+        print(f"Resolving {len(unique_names)} unique packages with "
+              f"{workers} workers...")
+        try:
+            licenses = resolve_licenses_parallel(unique_names, base, workers)
+        except Exception as e:
+            print(f"Error resolving packages in parallel: {e}",
+                  file=sys.stderr)
+            return
+
     # Iterate through the DataFrame rows
     # Using .loc for safe assignment based on index
     for index, row in df.iterrows():
         if row['UBI?'].lower() == 'no':
             package_name = row['package']
             print(f"Processing package: {package_name}...")
-            new_license = get_package_license(package_name, base)
+            if licenses is None:
+                new_license = get_package_license(package_name, base)
+            else:
+                new_license = licenses[package_name]
             df.loc[index, 'License'] = new_license
             print(f"  Updated license for {package_name}: {new_license}")
         else:
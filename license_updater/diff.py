@@ -0,0 +1,121 @@
+"""
+Compare two license-updated CSV files.
+
+The old file is loaded into a dictionary keyed on the 'package' column and
+the new file is streamed against it, so each file is read exactly once.
+"""
+
+import csv
+import json
+import sys
+
+
+def _read_rows(csv_file_path):
+    """
+    Stream (package, UBI?, License) tuples from a license CSV.
+
+    Args:
+        csv_file_path (str): Path to a CSV with the update_licenses_from_dnf
+                             column layout.
+
+    Yields:
+        tuple: (package, ubi, license) for each row with a package name.
+    """
+    with open(csv_file_path, newline='', encoding='utf-8-sig') as csv_file:
+        reader = csv.reader(csv_file)
+        header = next(reader, [])
+        missing = {'package', 'License'} - set(header)
+        if missing:
+            raise ValueError(f"missing column(s): {', '.join(sorted(missing))}")
+
+        # Index row lists directly; building a dict per row is too slow
+        # for million-row files
+        package_index = header.index('package')
+        license_index = header.index('License')
+        ubi_index = header.index('UBI?') if 'UBI?' in header else None
+        width = max(package_index, license_index, ubi_index or 0) + 1
+        for row in reader:
+            if len(row) < width:
+                row += [''] * (width - len(row))
+            package_name = row[package_index]
+            if package_name:
+                ubi = row[ubi_index] if ubi_index is not None else ''
+                yield package_name, ubi, row[license_index]
+
+
+def diff_license_csvs(old_csv_path, new_csv_path):
+    """
+    Hash-join two license CSVs on 'package' and report what changed.
+
+    If a package appears more than once in a file, its first row is used.
+
+    Args:
+        old_csv_path (str): Path to the older CSV.
+        new_csv_path (str): Path to the newer CSV.
+
+    Returns:
+        dict: Lists under 'added', 'removed' and 'changed'. Added and removed
+              entries hold 'package', 'UBI?' and 'License'; changed entries
+              hold 'package', 'old_license' and 'new_license'. Returns None
+              if either file could not be read.
+    """
+    current_path = old_csv_path
+    try:
+        old_rows = {}
+        for package_name, ubi, license_str in _read_rows(old_csv_path):
+            old_rows.setdefault(package_name, (ubi, license_str))
+
+        current_path = new_csv_path
+        added = []
+        changed = []
+        seen = set()
+        for package_name, ubi, license_str in _read_rows(new_csv_path):
+            if package_name in seen:
+                continue
+            seen.add(package_name)
+            old = old_rows.get(package_name)
+            if old is None:
+                added.append({'package': package_name, 'UBI?': ubi,
+                              'License': license_str})
+            elif old[1] != license_str:
+                changed.append({'package': package_name,
+                                'old_license': old[1],
+                                'new_license': license_str})
+    except FileNotFoundError:
+        print(f"Error: The file '{current_path}' was not found.",
+              file=sys.stderr)
+        return None
+    except Exception as e:
+        print(f"Error reading CSV file '{current_path}': {e}",
+              file=sys.stderr)
+        return None
+
+    removed = [{'package': package_name, 'UBI?': ubi, 'License': license_str}
+               for package_name, (ubi, license_str) in old_rows.items()
+               if package_name not in seen]
+
+    return {'added': added, 'removed': removed, 'changed': changed}
+
+
+def print_license_diff(result, as_json=False):
+    """
+    Print a diff produced by diff_license_csvs.
+
+    Args:
+        result (dict): Output of diff_license_csvs.
+        as_json (bool, optional): Print the result as JSON instead of text.
+    """
+    if as_json:
+        json.dump(result, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+        return
+
+    for row in result['added']:
+        print(f"+ {row['package']}: {row['License']}")
+    for row in result['removed']:
+        print(f"- {row['package']}: {row['License']}")
+    for row in result['changed']:
+        print(f"~ {row['package']}: {row['old_license']} -> "
+              f"{row['new_license']}")
+    print(f"\n{len(result['added'])} added, {len(result['removed'])} removed, "
+          f"{len(result['changed'])} license-changed")
@@ -1,11 +1,23 @@
+import asyncio
 import unittest
 from unittest.mock import patch, MagicMock
 import pandas as pd
 import sys
 import io
+import json
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures.process import BrokenProcessPool
+from license_updater.aio import AsyncLicenseResolver, _get_default_resolver
+from license_updater.cli import main
+from license_updater.diff import diff_license_csvs
 from license_updater.core import (
     get_package_license,
+    get_package_licenses,
     is_newer_package,
+    resolve_licenses_parallel,
     update_licenses_from_dnf
 )
 
@@ -214,6 +226,244 @@ class TestGetPackageLicense(unittest.TestCase):
         mock_base.fill_sack.assert_not_called()
 
 
+class TestGetPackageLicenses(unittest.TestCase):
+    """Test cases for get_package_licenses function"""
+
+    def test_single_query_for_all_names(self):
+        """Test that several names are resolved with one DNF query"""
+        mock_base = MagicMock()
+        mock_available_query = mock_base.sack.query.return_value.available.return_value
+        mock_filtered_query = mock_available_query.filter.return_value
+        mock_latest_query = mock_filtered_query.latest.return_value
+
+        pkg_a = MockPackage("pkg-a", license_str="MIT")
+        pkg_b_old = MockPackage("pkg-b", release="1.fc40", license_str="GPL-2.0")
+        pkg_b_new = MockPackage("pkg-b", release="3.fc40", license_str="GPL-3.0")
+        mock_filtered_query.__iter__ = lambda x: iter([pkg_a, pkg_b_old, pkg_b_new])
+        mock_latest_query.__iter__ = lambda x: iter([pkg_a, pkg_b_new])
+
+        result = get_package_licenses(
+            ["pkg-a.x86_64", "pkg-b", "missing"], base=mock_base)
+
+        self.assertEqual(result, {
+            "pkg-a.x86_64": "MIT",
+            "pkg-b": "GPL-3.0",
+            "missing": "N/A"
+        })
+        mock_base.sack.query.assert_called_once()
+        queried_names = mock_available_query.filter.call_args.kwargs["name"]
+        self.assertEqual(sorted(queried_names), ["missing", "pkg-a", "pkg-b"])
+
+    def test_multi_arch_matches_single_lookup(self):
+        """Test that sync and async lookups pick the same multi-arch package"""
+        mock_base = MagicMock()
+        mock_available_query = mock_base.sack.query.return_value.available.return_value
+        mock_filtered_query = mock_available_query.filter.return_value
+
+        # latest() keeps one package per arch; DNF lists x86_64 v1 first
+        pkg_x86_64 = MockPackage("pkg-a", version="1.0.0", license_str="MIT",
+                                 arch="x86_64")
+        pkg_i686 = MockPackage("pkg-a", version="2.0.0", license_str="GPL-3.0",
+                               arch="i686")
+        mock_filtered_query.__iter__ = lambda x: iter([pkg_x86_64, pkg_i686])
+        mock_filtered_query.latest.return_value.__iter__ = (
+            lambda x: iter([pkg_x86_64, pkg_i686]))
+
+        resolver = AsyncLicenseResolver(base=mock_base)
+        try:
+            async_result = asyncio.run(resolver.get_package_license("pkg-a"))
+        finally:
+            resolver.close()
+
+        sync_result = get_package_license("pkg-a", base=mock_base)
+        self.assertEqual(sync_result, "MIT")
+        self.assertEqual(async_result, sync_result)
+        self.assertEqual(get_package_licenses(["pkg-a"], base=mock_base),
+                         {"pkg-a": sync_result})
+
+    def test_latest_empty_fallback(self):
+        """Test the newest-package fallback when latest() returns nothing"""
+        mock_base = MagicMock()
+        mock_available_query = mock_base.sack.query.return_value.available.return_value
+        mock_filtered_query = mock_available_query.filter.return_value
+
+        pkg_old = MockPackage("pkg-a", release="1.fc40", license_str="GPL-2.0")
+        pkg_new = MockPackage("pkg-a", release="3.fc40", license_str="GPL-3.0")
+        mock_filtered_query.__iter__ = lambda x: iter([pkg_old, pkg_new])
+        mock_filtered_query.latest.return_value.__iter__ = lambda x: iter([])
+
+        self.assertEqual(get_package_licenses(["pkg-a"], base=mock_base),
+                         {"pkg-a": "GPL-3.0"})
+        self.assertEqual(get_package_license("pkg-a", base=mock_base), "GPL-3.0")
+
+    def test_query_error(self):
+        """Test that a failing query marks every name as an error"""
+        mock_base = MagicMock()
+        mock_base.sack.query.side_effect = Exception("sack error")
+
+        with patch('sys.stderr', new=io.StringIO()):
+            result = get_package_licenses(["pkg-a", "pkg-b"], base=mock_base)
+
+        self.assertEqual(result, {"pkg-a": "Error: Unexpected",
+                                  "pkg-b": "Error: Unexpected"})
+
+
+class TestAsyncLicenseResolver(unittest.TestCase):
+    """Test cases for AsyncLicenseResolver"""
+
+    @patch('license_updater.aio.get_package_licenses')
+    def test_coalesced_and_batched(self, mock_get_licenses):
+        """Test that concurrent lookups share one batched query"""
+        mock_get_licenses.side_effect = (
+            lambda names, base: {name: f"License-{name}" for name in names})
+        resolver = AsyncLicenseResolver(base=MagicMock())
+
+        async def lookup():
+            return await asyncio.gather(
+                resolver.get_package_license("pkg-a.x86_64"),
+                resolver.get_package_license("pkg-a"),
+                resolver.get_package_licenses(["pkg-b", "pkg-a"]))
+
+        try:
+            result = asyncio.run(lookup())
+        finally:
+            resolver.close()
+
+        self.assertEqual(result, [
+            "License-pkg-a",
+            "License-pkg-a",
+            {"pkg-b": "License-pkg-b", "pkg-a": "License-pkg-a"}
+        ])
+        mock_get_licenses.assert_called_once()
+        self.assertEqual(mock_get_licenses.call_args.args[0], ["pkg-a", "pkg-b"])
+
+    def test_lookup_after_close(self):
+        """Test that lookups fail right away once the resolver is closed"""
+        resolver = AsyncLicenseResolver(base=MagicMock())
+        resolver.close()
+
+        with self.assertRaises(RuntimeError):
+            asyncio.run(resolver.get_package_license("pkg-a"))
+
+    @patch('license_updater.aio.get_package_licenses')
+    def test_close_with_pending_batch(self, mock_get_licenses):
+        """Test that waiters fail instead of hanging if closed mid-batch"""
+        resolver = AsyncLicenseResolver(base=MagicMock())
+
+        async def lookup():
+            task = asyncio.ensure_future(resolver.get_package_license("pkg-a"))
+            await asyncio.sleep(0)
+            resolver.close()
+            return await asyncio.wait_for(task, timeout=5)
+
+        with self.assertRaises(RuntimeError):
+            asyncio.run(lookup())
+        mock_get_licenses.assert_not_called()
+
+    @patch('license_updater.aio.get_package_licenses')
+    @patch('license_updater.aio.dnf.Base')
+    def test_base_init_failure_retried(self, mock_dnf_base, mock_get_licenses):
+        """Test that a failed DNF init returns an error and is retried"""
+        failing_base = MagicMock()
+        failing_base.fill_sack.side_effect = Exception("repo unreachable")
+        working_base = MagicMock()
+        mock_dnf_base.side_effect = [failing_base, working_base]
+        mock_get_licenses.side_effect = (
+            lambda names, base: {name: "MIT" for name in names})
+        resolver = AsyncLicenseResolver()
+
+        async def lookup():
+            first = await resolver.get_package_license("pkg-a")
+            second = await resolver.get_package_license("pkg-a")
+            return first, second
+
+        try:
+            with patch('sys.stderr', new=io.StringIO()) as fake_stderr:
+                result = asyncio.run(lookup())
+        finally:
+            resolver.close()
+
+        self.assertEqual(result, ("Error: Unexpected", "MIT"))
+        self.assertIn("Error initializing DNF", fake_stderr.getvalue())
+        mock_get_licenses.assert_called_once_with(["pkg-a"], working_base)
+
+    @patch('license_updater.aio.get_package_licenses')
+    def test_cancelled_caller_keeps_shared_lookup(self, mock_get_licenses):
+        """Test that cancelling one waiter does not cancel the others"""
+        mock_get_licenses.side_effect = (
+            lambda names, base: {name: "MIT" for name in names})
+        resolver = AsyncLicenseResolver(base=MagicMock(), batch_window=0.05)
+
+        async def lookup():
+            cancelled = asyncio.ensure_future(
+                resolver.get_package_license("pkg-a"))
+            waiter = asyncio.ensure_future(
+                resolver.get_package_license("pkg-a"))
+            await asyncio.sleep(0)
+            cancelled.cancel()
+            return await waiter, cancelled.cancelled()
+
+        try:
+            result = asyncio.run(lookup())
+        finally:
+            resolver.close()
+
+        self.assertEqual(result, ("MIT", True))
+        mock_get_licenses.assert_called_once()
+
+    @patch('license_updater.aio.get_package_licenses')
+    def test_shared_by_several_loops(self, mock_get_licenses):
+        """Test that one resolver serves event loops in several threads"""
+        mock_get_licenses.side_effect = (
+            lambda names, base: {name: f"License-{name}" for name in names})
+        resolver = AsyncLicenseResolver(base=MagicMock())
+        results = {}
+
+        def run(index):
+            results[index] = asyncio.run(asyncio.wait_for(
+                resolver.get_package_licenses([f"pkg-{index}", "shared"]),
+                timeout=5))
+
+        threads = [threading.Thread(target=run, args=(i,)) for i in range(4)]
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            resolver.close()
+
+        self.assertEqual(len(results), 4)
+        for index, licenses in results.items():
+            self.assertEqual(licenses, {f"pkg-{index}": f"License-pkg-{index}",
+                                        "shared": "License-shared"})
+
+
+class TestDefaultResolver(unittest.TestCase):
+    """Test cases for the shared default resolver"""
+
+    @patch('license_updater.aio._default_resolver', None)
+    @patch('license_updater.aio.AsyncLicenseResolver')
+    def test_created_once_across_threads(self, mock_resolver_class):
+        """Test that racing first calls create a single resolver"""
+        def slow_resolver():
+            time.sleep(0.05)
+            return MagicMock()
+        mock_resolver_class.side_effect = slow_resolver
+        resolvers = []
+
+        threads = [threading.Thread(
+            target=lambda: resolvers.append(_get_default_resolver()))
+            for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        mock_resolver_class.assert_called_once()
+        self.assertEqual(len({id(resolver) for resolver in resolvers}), 1)
+
+
 class TestIsNewerPackage(unittest.TestCase):
     """Test cases for is_newer_package function"""
 
@@ -377,6 +627,198 @@ class TestUpdateLicensesFromDnf(unittest.TestCase):
         mock_to_csv.assert_called_once_with("output.csv", index=False)
 
 
+def fake_license(package_name, base=None):
+    """Module-level stand-in for get_package_license usable by workers"""
+    return f"License-{package_name}"
+
+
+def crashing_license(package_name, base=None):
+    """Stand-in for get_package_license that kills its worker process"""
+    if package_name == "package3":
+        os._exit(1)
+    return f"License-{package_name}"
+
+
+class TestResolveLicensesParallel(unittest.TestCase):
+    """Test cases for resolve_licenses_parallel function"""
+
+    @patch('license_updater.core.get_package_license', side_effect=fake_license)
+    def test_results_merged_in_input_order(self, mock_get_license):
+        """Test that shards are merged back in input order"""
+        names = [f"package{i}" for i in range(10)]
+
+        result = resolve_licenses_parallel(names, MagicMock(), 4)
+
+        self.assertEqual(list(result.keys()), names)
+        self.assertEqual(result["package7"], "License-package7")
+
+    @patch('license_updater.core.get_package_license', side_effect=crashing_license)
+    def test_dead_worker_raises(self, mock_get_license):
+        """Test that a worker dying raises instead of blocking forever"""
+        names = [f"package{i}" for i in range(8)]
+
+        with self.assertRaises(BrokenProcessPool):
+            resolve_licenses_parallel(names, MagicMock(), 4)
+
+    @patch('license_updater.core.multiprocessing.get_context')
+    @patch('license_updater.core.get_package_license', side_effect=fake_license)
+    def test_single_worker_runs_in_process(self, mock_get_license, mock_get_context):
+        """Test that one worker resolves in-process without forking"""
+        mock_base = MagicMock()
+
+        result = resolve_licenses_parallel(["a", "b"], mock_base, 1)
+
+        self.assertEqual(result, {"a": "License-a", "b": "License-b"})
+        mock_get_context.assert_not_called()
+        mock_get_license.assert_any_call("a", mock_base)
+
+    @patch('license_updater.core.resolve_licenses_parallel')
+    @patch('license_updater.core.dnf.Base')
+    @patch('pandas.read_csv')
+    def test_update_with_workers(self, mock_read_csv, mock_dnf_base, mock_resolve):
+        """Test that workers resolve unique names once and fill every row"""
+        df = pd.DataFrame({
+            'UBI?': ['no', 'yes', 'No', 'no'],
+            'package': ['pkg-a', 'ubi-package', 'pkg-b', 'pkg-a'],
+            'License': ['', '', '', '']
+        })
+        mock_read_csv.return_value = df
+        mock_base = MagicMock()
+        mock_dnf_base.return_value = mock_base
+        mock_resolve.return_value = {'pkg-a': 'MIT', 'pkg-b': 'GPL-2.0'}
+
+        with patch('sys.stdout', new=io.StringIO()):
+            update_licenses_from_dnf("test.csv", workers=4)
+
+        mock_resolve.assert_called_once_with(['pkg-a', 'pkg-b'], mock_base, 4)
+        self.assertEqual(list(df['License']), ['MIT', '', 'GPL-2.0', 'MIT'])
+
+
+class TestDiffLicenseCsvs(unittest.TestCase):
+    """Test cases for diff_license_csvs function and the diff command"""
+
+    def setUp(self):
+        """Write old and new CSV files"""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.old_csv = os.path.join(self.tmpdir.name, "old.csv")
+        self.new_csv = os.path.join(self.tmpdir.name, "new.csv")
+        with open(self.old_csv, "w") as f:
+            f.write("UBI?,package,License\n"
+                    "no,pkg-same,MIT\n"
+                    "no,pkg-changed,GPL-2.0\n"
+                    "no,pkg-removed,BSD\n")
+        with open(self.new_csv, "w") as f:
+            f.write("UBI?,package,License\n"
+                    "no,pkg-added,Apache-2.0\n"
+                    "no,pkg-changed,GPL-2.0-or-later\n"
+                    "no,pkg-same,MIT\n")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_added_removed_changed(self):
+        """Test that rows are classified after joining on package"""
+        result = diff_license_csvs(self.old_csv, self.new_csv)
+
+        self.assertEqual(result['added'], [
+            {'package': 'pkg-added', 'UBI?': 'no', 'License': 'Apache-2.0'}
+        ])
+        self.assertEqual(result['removed'], [
+            {'package': 'pkg-removed', 'UBI?': 'no', 'License': 'BSD'}
+        ])
+        self.assertEqual(result['changed'], [
+            {'package': 'pkg-changed', 'old_license': 'GPL-2.0',
+             'new_license': 'GPL-2.0-or-later'}
+        ])
+
+    def test_file_not_found(self):
+        """Test handling when one of the CSV files is missing"""
+        with patch('sys.stderr', new=io.StringIO()) as fake_stderr:
+            result = diff_license_csvs(self.old_csv, "nonexistent.csv")
+
+        self.assertIsNone(result)
+        self.assertIn("'nonexistent.csv' was not found", fake_stderr.getvalue())
+
+    def write_csv(self, name, content, encoding="utf-8"):
+        """Write a CSV file into the temporary directory"""
+        path = os.path.join(self.tmpdir.name, name)
+        with open(path, "w", encoding=encoding) as f:
+            f.write(content)
+        return path
+
+    def test_utf8_bom(self):
+        """Test that a byte-order mark does not hide the first column"""
+        bom_csv = self.write_csv("bom.csv",
+                                 "UBI?,package,License\n"
+                                 "yes,pkg-same,MIT\n"
+                                 "no,pkg-changed,GPL-3.0\n",
+                                 encoding="utf-8-sig")
+
+        result = diff_license_csvs(self.old_csv, bom_csv)
+
+        self.assertEqual(result['changed'], [
+            {'package': 'pkg-changed', 'old_license': 'GPL-2.0',
+             'new_license': 'GPL-3.0'}
+        ])
+        self.assertEqual(result['removed'][0]['UBI?'], 'no')
+
+    def test_missing_column(self):
+        """Test that a CSV without a License column is reported"""
+        bad_csv = self.write_csv("bad.csv", "UBI?,package\nno,pkg-same\n")
+
+        with patch('sys.stderr', new=io.StringIO()) as fake_stderr:
+            result = diff_license_csvs(self.old_csv, bad_csv)
+
+        self.assertIsNone(result)
+        self.assertIn("missing column(s): License", fake_stderr.getvalue())
+
+    def test_short_rows_padded(self):
+        """Test that rows missing trailing fields get empty values"""
+        short_csv = self.write_csv("short.csv",
+                                   "UBI?,package,License\n"
+                                   "no,pkg-same\n")
+
+        result = diff_license_csvs(self.old_csv, short_csv)
+
+        self.assertIn({'package': 'pkg-same', 'old_license': 'MIT',
+                       'new_license': ''}, result['changed'])
+
+    def test_duplicate_packages_first_row_wins(self):
+        """Test that only the first row of a repeated package is used"""
+        dup_csv = self.write_csv("dup.csv",
+                                 "UBI?,package,License\n"
+                                 "no,pkg-same,MIT\n"
+                                 "no,pkg-same,GPL-2.0\n"
+                                 "no,pkg-changed,GPL-2.0\n"
+                                 "no,pkg-removed,BSD\n")
+
+        unchanged = {'added': [], 'removed': [], 'changed': []}
+        self.assertEqual(diff_license_csvs(dup_csv, self.old_csv), unchanged)
+        self.assertEqual(diff_license_csvs(self.old_csv, dup_csv), unchanged)
+
+    def test_without_ubi_column(self):
+        """Test that the UBI? column is optional"""
+        no_ubi_csv = self.write_csv("no_ubi.csv",
+                                    "package,License\n"
+                                    "pkg-same,MIT\n"
+                                    "pkg-new,BSD\n")
+
+        result = diff_license_csvs(self.old_csv, no_ubi_csv)
+
+        self.assertEqual(result['added'], [
+            {'package': 'pkg-new', 'UBI?': '', 'License': 'BSD'}
+        ])
+
+    def test_cli_json_output(self):
+        """Test the diff subcommand with JSON output"""
+        with patch('sys.stdout', new=io.StringIO()) as fake_stdout:
+            main(["diff", self.old_csv, self.new_csv, "--json"])
+
+        result = json.loads(fake_stdout.getvalue())
+        self.assertEqual([row['package'] for row in result['changed']],
+                         ['pkg-changed'])
+
+
 class TestIntegration(unittest.TestCase):
     """Integration tests"""
 